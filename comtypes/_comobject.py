@@ -1,3 +1,4 @@
+import functools
 import logging
 import queue
 from _ctypes import COMError, CopyComPointer
@@ -11,6 +12,8 @@ from ctypes import (
     c_void_p,
     c_wchar_p,
     pointer,
+    sizeof,
+    string_at,
 )
 from ctypes.wintypes import INT, LONG, LPVOID, UINT, ULONG, WORD
 from typing import (
@@ -22,19 +25,24 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
 )
 from typing import Union as _UnionT
 
-import comtypes
 from comtypes import GUID, IPersist, IUnknown, _CoUninitialize, hresult
 from comtypes._memberspec import DISPATCH_METHOD as DISPATCH_METHOD
 from comtypes._memberspec import DISPATCH_PROPERTYGET as DISPATCH_PROPERTYGET
 from comtypes._memberspec import DISPATCH_PROPERTYPUT as DISPATCH_PROPERTYPUT
 from comtypes._memberspec import DISPATCH_PROPERTYPUTREF as DISPATCH_PROPERTYPUTREF
-from comtypes._vtbl import _MethodFinder, create_dispimpl, create_vtbl_mapping
+from comtypes._vtbl import (
+    _dispimpl_key,
+    _MethodFinder,
+    create_dispimpl,
+    create_vtbl_mapping,
+)
 from comtypes.automation import DISPID, DISPPARAMS, EXCEPINFO, VARIANT
 from comtypes.errorinfo import ISupportErrorInfo
 from comtypes.typeinfo import (
@@ -42,6 +50,7 @@ from comtypes.typeinfo import (
     IProvideClassInfo,
     IProvideClassInfo2,
     ITypeInfo,
+    LoadRegTypeLib,
 )
 
 if TYPE_CHECKING:
@@ -65,10 +74,13 @@ try:
 except AttributeError:
     import threading
 
+    # win 64 doesn't have these functions; they are compiler intrinsics
+    # there, like InterlockedExchangeAdd, and ntdll doesn't export them
+    # either.  So this is the normal path on win 64, not an error.
+    _debug("No interlocked functions in kernel32, using a lock for refcounts")
     _lock = threading.Lock()
     _acquire = _lock.acquire
     _release = _lock.release
-    # win 64 doesn't have these functions
 
     def _InterlockedIncrement(ob: c_long) -> int:
         _acquire()
@@ -145,7 +157,12 @@ _PostQuitMessage.restype = None
 
 
 class LocalServer:
-    _queue: Optional[queue.Queue] = None
+    __slots__ = ("_queue",)
+
+    _queue: Optional[queue.Queue]
+
+    def __init__(self) -> None:
+        self._queue = None
 
     def run(self, classobjects: Sequence["hints.localserver.ClassFactory"]) -> None:
         hr = _CoInitialize(None)
@@ -187,6 +204,8 @@ class LocalServer:
 
 
 class InprocServer:
+    __slots__ = ("locks",)
+
     def __init__(self) -> None:
         self.locks = c_long(0)
 
@@ -206,16 +225,34 @@ class InprocServer:
 
 _T_IUnknown = TypeVar("_T_IUnknown", bound=IUnknown)
 
+# Interned raw bytes of the iids, used as the keys of the
+# `_com_pointers_raw_` dicts; all the COMObject instances share them.
+_raw_iids: Dict[bytes, bytes] = {}
+
+
+def _get_raw_iid(iid: GUID) -> bytes:
+    raw = bytes(iid)
+    return _raw_iids.setdefault(raw, raw)
+
 
 class COMObject:
+    # No `__slots__` here: `POINTER(<CoClass>)` types derive from both a
+    # COMObject subclass and `c_void_p`, which would be an instance lay-out
+    # conflict.
     _com_interfaces_: ClassVar[List[Type[IUnknown]]]
     _outgoing_interfaces_: ClassVar[List[Type["hints.IDispatch"]]]
-    _instances_: ClassVar[Dict["COMObject", None]] = {}
+    _instances_: ClassVar[Set["COMObject"]] = set()
     _reg_clsid_: ClassVar[GUID]
     _reg_typelib_: ClassVar[Tuple[str, int, int]]
     __typelib: "hints.ITypeLib"
+    # Set by __get_interfaces, see there.
+    __interfaces: ClassVar[
+        Tuple[Tuple[Type[IUnknown], ...], Optional["hints.ITypeLib"]]
+    ]
+    __interfaces_cls: ClassVar[Type["COMObject"]]
     _com_pointers_: Dict[GUID, "hints.LP_LP_Vtbl"]
-    _dispimpl_: Dict[Tuple[comtypes.dispid, int], Callable[..., Any]]
+    _com_pointers_raw_: Dict[bytes, "hints.LP_LP_Vtbl"]
+    _dispimpl_: Dict[int, Callable[..., Any]]
 
     def __new__(cls, *args: Any, **kw: Any) -> "hints.Self":
         self = super().__new__(cls)
@@ -236,9 +273,39 @@ class COMObject:
         # The _com_pointers_ instance variable maps string interface iids
         # to C compatible COM pointers.
         self._com_pointers_ = {}
+        # The same pointers, keyed by the 16 raw bytes of the iids.  This
+        # is what IUnknown_QueryInterface looks up, so that it does not
+        # have to create a GUID instance from 'riid' on each call.
+        self._com_pointers_raw_ = {}
         # COM refcount starts at zero.
         self._refcnt = c_long(0)
 
+        interfaces, typelib = self.__get_interfaces()
+        if typelib is not None:
+            self.__typelib = typelib
+        for itf in interfaces:
+            self.__make_interface_pointer(itf)
+
+    @classmethod
+    def __get_interfaces(
+        cls,
+    ) -> Tuple[Tuple[Type[IUnknown], ...], Optional["hints.ITypeLib"]]:
+        # Returns the interfaces to build COM pointers for, in the order
+        # they must be built, and the type library of the class.
+        #
+        # These only depend on the class, so they are computed once, when
+        # the first instance is created, and cached on the class itself.
+        # This cannot be done when the class is created, since the
+        # generated modules assign _com_interfaces_ after the class
+        # statement.
+        #
+        # A subclass inherits the cache of its base class, which is only
+        # used if it was made for this very class.
+        try:
+            if cls.__interfaces_cls is cls:
+                return cls.__interfaces
+        except AttributeError:
+            pass
         # Some interfaces have a default implementation in COMObject:
         # - ISupportErrorInfo
         # - IPersist (if the subclass has a _reg_clsid_ attribute)
@@ -247,32 +314,35 @@ class COMObject:
         #   attribute)
         #
         # Add these if they are not listed in _com_interfaces_.
-        interfaces = tuple(self._com_interfaces_)
+        interfaces = tuple(cls._com_interfaces_)
+        typelib = None
         if ISupportErrorInfo not in interfaces:
             interfaces += (ISupportErrorInfo,)
-        if hasattr(self, "_reg_typelib_"):
-            from comtypes.typeinfo import LoadRegTypeLib
-
-            self._COMObject__typelib = LoadRegTypeLib(*self._reg_typelib_)
-            if hasattr(self, "_reg_clsid_"):
+        if hasattr(cls, "_reg_typelib_"):
+            typelib = LoadRegTypeLib(*cls._reg_typelib_)
+            if hasattr(cls, "_reg_clsid_"):
                 if IProvideClassInfo not in interfaces:
                     interfaces += (IProvideClassInfo,)
                 if (
-                    hasattr(self, "_outgoing_interfaces_")
+                    hasattr(cls, "_outgoing_interfaces_")
                     and IProvideClassInfo2 not in interfaces
                 ):
                     interfaces += (IProvideClassInfo2,)
-        if hasattr(self, "_reg_clsid_"):
+        if hasattr(cls, "_reg_clsid_"):
             if IPersist not in interfaces:
                 interfaces += (IPersist,)
-        for itf in interfaces[::-1]:
-            self.__make_interface_pointer(itf)
+        cls.__interfaces = (interfaces[::-1], typelib)
+        cls.__interfaces_cls = cls
+        return cls.__interfaces
 
     def __make_interface_pointer(self, itf: Type[IUnknown]) -> None:
         finder = self._get_method_finder_(itf)
         iids, vtbl = create_vtbl_mapping(itf, finder)
-        for iid in iids:
-            self._com_pointers_[iid] = pointer(pointer(vtbl))
+        # All the iids of the interface hierarchy share the same vtbl, and
+        # so the same COM pointer to it.
+        ptr = pointer(pointer(vtbl))
+        self._com_pointers_.update(dict.fromkeys(iids, ptr))
+        self._com_pointers_raw_.update(dict.fromkeys(map(_get_raw_iid, iids), ptr))
         if hasattr(itf, "_disp_methods_"):
             self._dispimpl_ = create_dispimpl(itf, finder)
 
@@ -305,20 +375,20 @@ class COMObject:
 
     @staticmethod
     def __keep__(obj: "COMObject") -> None:
-        COMObject._instances_[obj] = None
-        _debug("%d active COM objects: Added   %r", len(COMObject._instances_), obj)
+        COMObject._instances_.add(obj)
+        if logger.isEnabledFor(logging.DEBUG):
+            _debug("%d active COM objects: Added   %r", len(COMObject._instances_), obj)
         if COMObject.__server__:
             COMObject.__server__.Lock()
 
     @staticmethod
     def __unkeep__(obj: "COMObject") -> None:
-        try:
-            del COMObject._instances_[obj]
-        except AttributeError:
-            _debug("? active COM objects: Removed %r", obj)
-        else:
+        COMObject._instances_.discard(obj)
+        # Avoid building the arguments of these messages if they are not
+        # logged anyway.
+        if logger.isEnabledFor(logging.DEBUG):
             _debug("%d active COM objects: Removed %r", len(COMObject._instances_), obj)
-        _debug("Remaining: %s", list(COMObject._instances_.keys()))
+            _debug("Remaining: %s", list(COMObject._instances_))
         if COMObject.__server__:
             COMObject.__server__.Unlock()
 
@@ -361,6 +431,7 @@ class COMObject:
             self.__unkeep__(self)
             # Hm, why isn't this cleaned up by the cycle gc?
             self._com_pointers_ = {}
+            self._com_pointers_raw_ = {}
         return result
 
     def IUnknown_QueryInterface(
@@ -370,15 +441,17 @@ class COMObject:
         ppvObj: _UnionT[c_void_p, "_CArgObject"],
         _debug=_debug,
     ) -> int:
-        # XXX This is probably too slow.
-        # riid[0].hashcode() alone takes 33 us!
-        iid = riid[0]
-        ptr = self._com_pointers_.get(iid, None)
+        # Dereferencing 'riid' creates a GUID instance, and hashing it
+        # is slow (riid[0].hashcode() alone took 33 us!), so we look up
+        # the raw bytes of the iid instead.
+        ptr = self._com_pointers_raw_.get(string_at(riid, sizeof(GUID)), None)
         if ptr is not None:
             # CopyComPointer(src, dst) calls AddRef!
-            _debug("%r.QueryInterface(%s) -> S_OK", self, iid)
+            if logger.isEnabledFor(logging.DEBUG):
+                _debug("%r.QueryInterface(%s) -> S_OK", self, riid[0])
             return CopyComPointer(ptr, ppvObj)
-        _debug("%r.QueryInterface(%s) -> E_NOINTERFACE", self, iid)
+        if logger.isEnabledFor(logging.DEBUG):
+            _debug("%r.QueryInterface(%s) -> E_NOINTERFACE", self, riid[0])
         return hresult.E_NOINTERFACE
 
     def QueryInterface(self, interface: Type[_T_IUnknown]) -> _T_IUnknown:
@@ -404,7 +477,7 @@ class COMObject:
     def ISupportErrorInfo_InterfaceSupportsErrorInfo(
         self, this: Any, riid: "_Pointer[GUID]"
     ) -> int:
-        if riid[0] in self._com_pointers_:
+        if string_at(riid, sizeof(GUID)) in self._com_pointers_raw_:
             return hresult.S_OK
         return hresult.S_FALSE
 
@@ -427,10 +500,11 @@ class COMObject:
 
     ################################################################
     # IDispatch methods
-    @property
+    @functools.cached_property
     def __typeinfo(self):
-        # XXX Looks like this better be a static property, set by the
-        # code that sets __typelib also...
+        # The typelib and the iid do not change, so the typeinfo is only
+        # retrieved on first access.  If there is no typelib, the
+        # AttributeError is raised again on each access.
         iid = self._com_interfaces_[0]._iid_
         return self.__typelib.GetTypeInfoOfGuid(iid)
 
@@ -473,9 +547,10 @@ class COMObject:
         pExcepInfo,
         puArgErr,
     ):
-        try:
-            self._dispimpl_
-        except AttributeError:
+        # '_dispimpl_' is missing when no interface of the object is a
+        # dispinterface or a dual interface.
+        dispimpl = getattr(self, "_dispimpl_", None)
+        if dispimpl is None:
             try:
                 tinfo = self.__typeinfo
             except AttributeError:
@@ -501,55 +576,13 @@ class COMObject:
                 puArgErr,
             )
 
-        try:
-            # XXX Hm, wFlags should be considered a SET of flags...
-            mth = self._dispimpl_[(dispIdMember, wFlags)]
-        except KeyError:
+        # XXX Hm, wFlags should be considered a SET of flags...
+        invoker = dispimpl.get(_dispimpl_key(dispIdMember, wFlags), None)
+        if invoker is None:
             return hresult.DISP_E_MEMBERNOTFOUND
-
-        # Unpack the parameters: It would be great if we could use the
-        # DispGetParam function - but we cannot since it requires that
-        # we pass a VARTYPE for each argument and we do not know that.
-        #
-        # Seems that n arguments have dispids (0, 1, ..., n-1).
-        # Unnamed arguments are packed into the DISPPARAMS array in
-        # reverse order (starting with the highest dispid), named
-        # arguments are packed in the order specified by the
-        # rgdispidNamedArgs array.
-        #
-        params = pDispParams[0]
-
-        if wFlags & (DISPATCH_PROPERTYPUT | DISPATCH_PROPERTYPUTREF):
-            # How are the parameters unpacked for propertyput
-            # operations with additional parameters?  Can propput
-            # have additional args?
-            args = [
-                params.rgvarg[i].value for i in reversed(list(range(params.cNamedArgs)))
-            ]
-            # MSDN: pVarResult is ignored if DISPATCH_PROPERTYPUT or
-            # DISPATCH_PROPERTYPUTREF is specified.
-            return mth(this, *args)
-
-        else:  # wFlags & (DISPATCH_METHOD | DISPATCH_PROPERTYGET)
-            # the positions of named arguments
-            #
-            # 2to3 has problems to translate 'range(...)[::-1]'
-            # correctly, so use 'list(range)[::-1]' instead (will be
-            # fixed in Python 3.1, probably):
-            named_indexes = [
-                params.rgdispidNamedArgs[i] for i in range(params.cNamedArgs)
-            ]
-            # the positions of unnamed arguments
-            num_unnamed = params.cArgs - params.cNamedArgs
-            unnamed_indexes = list(reversed(list(range(num_unnamed))))
-            # It seems that this code calculates the indexes of the
-            # parameters in the params.rgvarg array correctly.
-            indexes = named_indexes + unnamed_indexes
-            args = [params.rgvarg[i].value for i in indexes]
-
-            if pVarResult and getattr(mth, "has_outargs", False):
-                args.append(pVarResult)
-            return mth(this, *args)
+        # The invoker unpacks the parameters in the way that is right for
+        # the kind of member, and calls the implementation.
+        return invoker(this, pDispParams[0], pVarResult)
 
     ################################################################
     # IPersist interface
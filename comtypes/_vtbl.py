@@ -1,6 +1,10 @@
+import functools
 import logging
+import sys
+import weakref
 from _ctypes import COMError
 from ctypes import WINFUNCTYPE, Structure, c_void_p
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -27,10 +31,15 @@ from comtypes._memberspec import (
 from comtypes.errorinfo import ReportError, ReportException
 
 if TYPE_CHECKING:
-    from ctypes import _FuncPointer
+    from ctypes import _CDataType, _FuncPointer
 
     from comtypes import hints  # type: ignore
-    from comtypes._memberspec import _ComIdlFlags, _DispIdlFlags, _DispMemberSpec
+    from comtypes._memberspec import (
+        _ComIdlFlags,
+        _DispIdlFlags,
+        _DispMemberSpec,
+    )
+    from comtypes.automation import DISPPARAMS
 
 logger = logging.getLogger(__name__)
 _debug = logger.debug
@@ -69,59 +78,244 @@ def winerror(exc: Exception) -> int:
     )
 
 
+def _not_implemented(interface_name: str, method_name: str, *args: Any) -> int:
+    """Return E_NOTIMPL because the method is not implemented."""
+    _debug("unimplemented method %s_%s called", interface_name, method_name)
+    return hresult.E_NOTIMPL
+
+
 def _do_implement(interface_name: str, method_name: str) -> Callable[..., int]:
-    def _not_implemented(*args):
-        """Return E_NOTIMPL because the method is not implemented."""
-        _debug("unimplemented method %s_%s called", interface_name, method_name)
-        return hresult.E_NOTIMPL
+    return functools.partial(_not_implemented, interface_name, method_name)
 
-    return _not_implemented
 
+def _no_inargs(args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    return ()
 
-def catch_errors(
-    obj: "hints.COMObject",
-    mth: Callable[..., Any],
-    paramflags: Optional[Tuple["hints.ParamFlagType", ...]],
-    interface: Type[IUnknown],
-    mthname: str,
-) -> Callable[..., Any]:
-    clsid = getattr(obj, "_reg_clsid_", None)
 
-    def call_with_this(*args, **kw):
+class _Trampoline:
+    """Calls a method implementation that does not accept the 'this'
+    pointer, passing the input arguments and storing the result(s) into
+    the output arguments.
+
+    One instance is created per vtable entry; unlike a closure, all of
+    them share the same code object.  This class handles methods without
+    output arguments, the subclasses below the ones with one or more.
+    """
+
+    __slots__ = (
+        "mth",
+        "interface",
+        "mthname",
+        "clsid",
+        "args_in_idx",
+        "args_out_idx",
+        "get_inargs",
+        "has_outargs",
+    )
+
+    def __init__(
+        self,
+        mth: Callable[..., Any],
+        interface: Type[IUnknown],
+        mthname: str,
+        clsid: Optional[GUID],
+        args_in_idx: Tuple[int, ...],
+        args_out_idx: Tuple[int, ...],
+    ) -> None:
+        self.mth = mth
+        self.interface = interface
+        self.mthname = mthname
+        self.clsid = clsid
+        self.args_in_idx = args_in_idx
+        self.args_out_idx = args_out_idx
+        # 'itemgetter' picks the input arguments in a single C call.  With
+        # only one index it would return the item itself instead of a tuple,
+        # so that case (and the one without input arguments) is sliced.
+        self.get_inargs: Callable[[Tuple[Any, ...]], Tuple[Any, ...]]
+        if len(args_in_idx) > 1:
+            self.get_inargs = itemgetter(*args_in_idx)
+        elif args_in_idx:
+            (i,) = args_in_idx
+            self.get_inargs = lambda args: args[i : i + 1]
+        else:
+            self.get_inargs = _no_inargs
+        self.has_outargs = bool(args_out_idx)
+
+    # Method implementations could check for and return E_POINTER
+    # themselves.  Or an error will be raised when
+    # 'outargs[i][0] = value' is executed.
+    # for a in outargs:
+    #     if not a:
+    #         return E_POINTER
+
+    def __call__(self, this, *args):
         try:
-            result = mth(*args, **kw)
-        except comtypes.ReturnHRESULT as err:
+            self.mth(*self.get_inargs(args))
+        except BaseException as err:
+            return self._report_error(err)
+        return hresult.S_OK
+
+    def _report_error(self, err: BaseException) -> int:
+        # Must be called from the 'except' clause, so that the traceback
+        # is logged.
+        interface, mthname, clsid = self.interface, self.mthname, self.clsid
+        if isinstance(err, comtypes.ReturnHRESULT):
             (hr, text) = err.args
             return ReportError(text, iid=interface._iid_, clsid=clsid, hresult=hr)
-        except (OSError, COMError) as details:
+        if isinstance(err, COMError):
+            (hr, text, details) = err.args
             _error(
                 "Exception in %s.%s implementation:",
                 interface.__name__,
                 mthname,
                 exc_info=True,
             )
-            return HRESULT_FROM_WIN32(winerror(details))
-        except E_NotImplemented:
-            _warning("Unimplemented method %s.%s called", interface.__name__, mthname)
-            return hresult.E_NOTIMPL
-        except:
+            try:
+                descr, source, helpfile, helpcontext, progid = details
+            except (ValueError, TypeError):
+                msg = str(details)
+            else:
+                msg = f"{source}: {descr}"
+            hr = HRESULT_FROM_WIN32(hr)
+            return ReportError(msg, iid=interface._iid_, clsid=clsid, hresult=hr)
+        if isinstance(err, OSError):
             _error(
                 "Exception in %s.%s implementation:",
                 interface.__name__,
                 mthname,
                 exc_info=True,
             )
-            return ReportException(hresult.E_FAIL, interface._iid_, clsid=clsid)
+            hr = HRESULT_FROM_WIN32(winerror(err))
+            return ReportException(hr, interface._iid_, clsid=clsid)
+        if isinstance(err, E_NotImplemented):
+            _warning("Unimplemented method %s.%s called", interface.__name__, mthname)
+            return hresult.E_NOTIMPL
+        _error(
+            "Exception in %s.%s implementation:",
+            interface.__name__,
+            mthname,
+            exc_info=True,
+        )
+        return ReportException(hresult.E_FAIL, interface._iid_, clsid=clsid)
+
+
+class _TrampolineAllIn(_Trampoline):
+    """Calls a method implementation whose arguments are all input
+    arguments, passing them unchanged.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, this, *args):
+        try:
+            self.mth(*args)
+        except BaseException as err:
+            return self._report_error(err)
+        return hresult.S_OK
+
+
+class _TrampolineOneOut(_Trampoline):
+    """Calls a method implementation that has exactly one output argument."""
+
+    __slots__ = ()
+
+    def __call__(self, this, *args):
+        try:
+            args[self.args_out_idx[0]][0] = self.mth(*self.get_inargs(args))
+        except BaseException as err:
+            return self._report_error(err)
+        return hresult.S_OK
+
+
+class _TrampolineManyOut(_Trampoline):
+    """Calls a method implementation that has several output arguments, and
+    returns a tuple of their values.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, this, *args):
+        args_out_idx = self.args_out_idx
+        try:
+            result = self.mth(*self.get_inargs(args))
+            if len(result) != len(args_out_idx):
+                msg = f"Method should have returned a {len(args_out_idx)}-tuple"
+                raise ValueError(msg)
+            for i, value in zip(args_out_idx, result):
+                args[i][0] = value
+        except BaseException as err:
+            return self._report_error(err)
+        return hresult.S_OK
+
+
+class _TrampolineThis(_Trampoline):
+    """Calls a method implementation that accepts the 'this' pointer,
+    passing all the arguments unchanged.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        mth: Callable[..., Any],
+        interface: Type[IUnknown],
+        mthname: str,
+        clsid: Optional[GUID],
+        has_outargs: bool,
+    ) -> None:
+        super().__init__(mth, interface, mthname, clsid, (), ())
+        self.has_outargs = has_outargs
+
+    def __call__(self, *args):
+        # ctypes calls the vtable entries (IUnknown_AddRef, IUnknown_Release
+        # and the like) with positional arguments only; accepting '**kw'
+        # would create an empty dict on every call.
+        try:
+            result = self.mth(*args)
+        except BaseException as err:
+            return self._report_error(err)
         if result is None:
             return hresult.S_OK
         return result
 
+    def _report_error(self, err: BaseException) -> int:
+        interface, mthname, clsid = self.interface, self.mthname, self.clsid
+        if isinstance(err, comtypes.ReturnHRESULT):
+            (hr, text) = err.args
+            return ReportError(text, iid=interface._iid_, clsid=clsid, hresult=hr)
+        if isinstance(err, (OSError, COMError)):
+            _error(
+                "Exception in %s.%s implementation:",
+                interface.__name__,
+                mthname,
+                exc_info=True,
+            )
+            return HRESULT_FROM_WIN32(winerror(err))
+        if isinstance(err, E_NotImplemented):
+            _warning("Unimplemented method %s.%s called", interface.__name__, mthname)
+            return hresult.E_NOTIMPL
+        _error(
+            "Exception in %s.%s implementation:",
+            interface.__name__,
+            mthname,
+            exc_info=True,
+        )
+        return ReportException(hresult.E_FAIL, interface._iid_, clsid=clsid)
+
+
+def catch_errors(
+    obj: "hints.COMObject",
+    mth: Callable[..., Any],
+    paramflags: Optional[Tuple["hints.ParamFlagType", ...]],
+    interface: Type[IUnknown],
+    mthname: str,
+) -> Callable[..., Any]:
+    clsid = getattr(obj, "_reg_clsid_", None)
     if paramflags is None:
         has_outargs = False
     else:
         has_outargs = bool([x[0] for x in paramflags if x[0] & 2])
-    call_with_this.has_outargs = has_outargs
-    return call_with_this
+    return _TrampolineThis(mth, interface, mthname, clsid, has_outargs)
 
 
 ################################################################
@@ -139,100 +333,71 @@ def hack(
     code = mth.__code__
     if code.co_varnames[1:2] == ("this",):
         return catch_errors(inst, mth, paramflags, interface, mthname)
-    dirflags = [f[0] for f in paramflags]
+    dirflags = tuple(f[0] for f in paramflags)
+    args_in_idx, args_out_idx = _get_arg_indexes(dirflags)
+
+    ## XXX Remove this:
+    # if args_in != code.co_argcount - 1:
+    #     return catch_errors(inst, mth, interface, mthname)
+
+    clsid = getattr(inst, "_reg_clsid_", None)
+    # Pick the trampoline specialized for the number of output arguments,
+    # so that it need not be checked on each call.
+    trampoline: Type[_Trampoline]
+    if args_out_idx:
+        if len(args_out_idx) == 1:
+            trampoline = _TrampolineOneOut
+        else:
+            trampoline = _TrampolineManyOut
+    elif len(args_in_idx) == len(dirflags):
+        trampoline = _TrampolineAllIn
+    else:
+        trampoline = _Trampoline
+    return trampoline(mth, interface, mthname, clsid, args_in_idx, args_out_idx)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_arg_indexes(
+    dirflags: Tuple[int, ...],
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Returns the indexes of the input arguments and of the output
+    arguments for the direction flags of a method's parameters.
+    """
     # An argument is an input arg either if flags are NOT set in the
     # idl file, or if the flags contain 'in'. In other words, the
     # direction flag is either exactly '0' or has the '1' bit set:
     # Output arguments have flag '2'
+    args_in_idx = tuple(i for i, a in enumerate(dirflags) if a & 1 or a == 0)
+    args_out_idx = tuple(i for i, a in enumerate(dirflags) if a & 2)
+    return (args_in_idx, args_out_idx)
 
-    args_out_idx = []
-    args_in_idx = []
-    for i, a in enumerate(dirflags):
-        if a & 2:
-            args_out_idx.append(i)
-        if a & 1 or a == 0:
-            args_in_idx.append(i)
-    args_out = len(args_out_idx)
 
-    ## XXX Remove this:
-    # if args_in != code.co_argcount - 1:
-    #     return catch_errors(inst, mth, interface, mthname)
+def _get_lower_names(cls: Type["hints.COMObject"]) -> Dict[str, str]:
+    try:
+        return _lower_names[cls]
+    except KeyError:
+        names = _lower_names[cls] = {n.lower(): n for n in dir(cls)}
+        return names
 
-    clsid = getattr(inst, "_reg_clsid_", None)
 
-    def call_without_this(this, *args):
-        # Method implementations could check for and return E_POINTER
-        # themselves.  Or an error will be raised when
-        # 'outargs[i][0] = value' is executed.
-        # for a in outargs:
-        #     if not a:
-        #         return E_POINTER
-
-        # make argument list for handler by index array built above
-        inargs = []
-        for a in args_in_idx:
-            inargs.append(args[a])
-        try:
-            result = mth(*inargs)
-            if args_out == 1:
-                args[args_out_idx[0]][0] = result
-            elif args_out != 0:
-                if len(result) != args_out:
-                    msg = f"Method should have returned a {args_out}-tuple"
-                    raise ValueError(msg)
-                for i, value in enumerate(result):
-                    args[args_out_idx[i]][0] = value
-        except comtypes.ReturnHRESULT as err:
-            (hr, text) = err.args
-            return ReportError(text, iid=interface._iid_, clsid=clsid, hresult=hr)
-        except COMError as err:
-            (hr, text, details) = err.args
-            _error(
-                "Exception in %s.%s implementation:",
-                interface.__name__,
-                mthname,
-                exc_info=True,
-            )
-            try:
-                descr, source, helpfile, helpcontext, progid = details
-            except (ValueError, TypeError):
-                msg = str(details)
-            else:
-                msg = f"{source}: {descr}"
-            hr = HRESULT_FROM_WIN32(hr)
-            return ReportError(msg, iid=interface._iid_, clsid=clsid, hresult=hr)
-        except OSError as details:
-            _error(
-                "Exception in %s.%s implementation:",
-                interface.__name__,
-                mthname,
-                exc_info=True,
-            )
-            hr = HRESULT_FROM_WIN32(winerror(details))
-            return ReportException(hr, interface._iid_, clsid=clsid)
-        except E_NotImplemented:
-            _warning("Unimplemented method %s.%s called", interface.__name__, mthname)
-            return hresult.E_NOTIMPL
-        except:
-            _error(
-                "Exception in %s.%s implementation:",
-                interface.__name__,
-                mthname,
-                exc_info=True,
-            )
-            return ReportException(hresult.E_FAIL, interface._iid_, clsid=clsid)
-        return hresult.S_OK
+# The names only depend on the class; the instance's own attributes (which
+# are created later, in `__init__`) are not COM method implementations.
+# Weak keys, since classes like the event sinks are created on the fly.
+_lower_names: "weakref.WeakKeyDictionary[type, Dict[str, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
-    if args_out:
-        call_without_this.has_outargs = True
-    return call_without_this
+# `getattr` default for attribute lookups that may fail; unlike catching
+# the AttributeError, this does not create an exception on a miss.
+_MISSING: Any = object()
 
 
 class _MethodFinder:
     def __init__(self, inst: "hints.COMObject") -> None:
         self.inst = inst
         # map lower case names to names with correct spelling.
-        self.names = dict([(n.lower(), n) for n in dir(inst)])
+        self.names = _get_lower_names(type(inst))
 
     def get_impl(
         self,
@@ -250,10 +415,11 @@ class _MethodFinder:
         # Try to find a method, first with the fully qualified name
         # ('IUnknown_QueryInterface'), if that fails try the simple
         # name ('QueryInterface')
-        try:
-            return getattr(self.inst, fq_name)
-        except AttributeError:
-            pass
+        mth = getattr(self.inst, fq_name, _MISSING)
+        if mth is not _MISSING:
+            return mth
+        # raises AttributeError if there is no such method, callers rely
+        # on that.
         return getattr(self.inst, mthname)
 
     def find_impl(
@@ -263,7 +429,11 @@ class _MethodFinder:
         paramflags: Optional[Tuple["hints.ParamFlagType", ...]],
         idlflags: _UnionT["_ComIdlFlags", "_DispIdlFlags"],
     ) -> Optional[Callable[..., Any]]:
-        fq_name = f"{interface.__name__}_{mthname}"
+        # The names are interned, so that the attribute lookups below can
+        # use the type attribute cache (names built at runtime are not
+        # interned).
+        mthname = sys.intern(mthname)
+        fq_name = sys.intern(f"{interface.__name__}_{mthname}")
         if interface._case_insensitive_:
             # simple name, like 'QueryInterface'
             mthname = self.names.get(mthname.lower(), mthname)
@@ -274,7 +444,7 @@ class _MethodFinder:
             return self.find_method(fq_name, mthname)
         except AttributeError:
             pass
-        propname = mthname[5:]  # strip the '_get_' or '_set' prefix
+        propname = sys.intern(mthname[5:])  # strip the '_get_' or '_set' prefix
         if interface._case_insensitive_:
             propname = self.names.get(propname.lower(), propname)
         # propput and propget is done with 'normal' attribute access,
@@ -328,6 +498,26 @@ def _create_vtbl_type(
 # Ugh. Another type cache to avoid leaking types.
 _vtbl_types: Dict[Tuple[Tuple[str, Type["_FuncPointer"]], ...], Type[Structure]] = {}
 
+
+def _get_proto(
+    restype: Optional[Type["_CDataType"]], argtypes: Sequence[Type["_CDataType"]]
+) -> Type["_FuncPointer"]:
+    # 'argtypes' may be a list in hand-written STDMETHOD definitions.
+    key = (restype, tuple(argtypes))
+    try:
+        return _proto_types[key]
+    except KeyError:
+        proto = _proto_types[key] = WINFUNCTYPE(restype, c_void_p, *argtypes)
+        return proto
+
+
+# The same signatures, like the ones of the IUnknown methods, appear in the
+# vtables of all the interfaces.  This saves calling WINFUNCTYPE for them.
+_proto_types: Dict[
+    Tuple[Optional[Type["_CDataType"]], Tuple[Type["_CDataType"], ...]],
+    Type["_FuncPointer"],
+] = {}
+
 ################################################################
 
 
@@ -340,7 +530,7 @@ def create_vtbl_mapping(
     for interface in _walk_itf_bases(itf):
         iids.append(interface._iid_)
         for m in interface._methods_:
-            proto = WINFUNCTYPE(m.restype, c_void_p, *m.argtypes)
+            proto = _get_proto(m.restype, m.argtypes)
             fields.append((m.name, proto))
             mth = finder.get_impl(interface, m.name, m.paramflags, m.idlflags)
             methods.append(proto(mth))
@@ -356,10 +546,125 @@ def _walk_itf_bases(itf: Type[IUnknown]) -> Iterator[Type[IUnknown]]:
     yield from itf.__mro__[-2::-1]
 
 
+# Unpack the parameters: It would be great if we could use the
+# DispGetParam function - but we cannot since it requires that
+# we pass a VARTYPE for each argument and we do not know that.
+#
+# Seems that n arguments have dispids (0, 1, ..., n-1).
+# Unnamed arguments are packed into the DISPPARAMS array in
+# reverse order (starting with the highest dispid), named
+# arguments are packed in the order specified by the
+# rgdispidNamedArgs array.
+
+
+def _get_dispargs(params: "DISPPARAMS") -> Sequence[Any]:
+    """Returns the values of the arguments of an `IDispatch::Invoke` call
+    of a method or a property get, in the order of their dispids.
+    """
+    # Each access of a structure field creates a new object, so the
+    # fields are read only once.
+    rgvarg = params.rgvarg
+    cArgs = params.cArgs
+    cNamedArgs = params.cNamedArgs
+    if cNamedArgs:
+        # the named arguments, at the positions given by
+        # rgdispidNamedArgs, followed by the unnamed arguments in
+        # reverse order.
+        #
+        # It seems that this code calculates the indexes of the
+        # parameters in the params.rgvarg array correctly.
+        rgNamed = params.rgdispidNamedArgs
+        args = [rgvarg[rgNamed[i]].value for i in range(cNamedArgs)]
+        num_unnamed = cArgs - cNamedArgs
+        args += [rgvarg[i].value for i in range(num_unnamed - 1, -1, -1)]
+        return args
+    # Most calls pass only a few unnamed arguments; these are
+    # unpacked into a tuple without a loop or list growth.
+    if cArgs == 0:
+        return ()
+    if cArgs == 1:
+        return (rgvarg[0].value,)
+    if cArgs == 2:
+        return (rgvarg[1].value, rgvarg[0].value)
+    if cArgs == 3:
+        return (rgvarg[2].value, rgvarg[1].value, rgvarg[0].value)
+    # A list comprehension is faster than 'tuple(<genexpr>)'.
+    return [rgvarg[i].value for i in range(cArgs - 1, -1, -1)]
+
+
+class _DispInvoker:
+    """Unpacks the parameters of an `IDispatch::Invoke` call of a method or
+    a property get, and calls the implementation with them.
+
+    One instance is stored in `_dispimpl_` for each member and invoke kind,
+    so that IDispatch_Invoke need not check the invoke kind on each call.
+    """
+
+    __slots__ = ("mth",)
+
+    def __init__(self, mth: Callable[..., Any]) -> None:
+        self.mth = mth
+
+    def __call__(self, this: Any, params: "DISPPARAMS", pVarResult: Any) -> Any:
+        return self.mth(this, *_get_dispargs(params))
+
+
+class _DispOutInvoker(_DispInvoker):
+    """Like `_DispInvoker`, for implementations with output arguments;
+    `pVarResult` is passed as the last argument, if the caller gave one.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, this: Any, params: "DISPPARAMS", pVarResult: Any) -> Any:
+        if pVarResult:
+            return self.mth(this, *_get_dispargs(params), pVarResult)
+        return self.mth(this, *_get_dispargs(params))
+
+
+class _DispPropPutInvoker(_DispInvoker):
+    """Unpacks the parameters of an `IDispatch::Invoke` call of a property
+    put or putref, and calls the implementation with them.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, this: Any, params: "DISPPARAMS", pVarResult: Any) -> Any:
+        # How are the parameters unpacked for propertyput
+        # operations with additional parameters?  Can propput
+        # have additional args?
+        rgvarg = params.rgvarg
+        args = [rgvarg[i].value for i in range(params.cNamedArgs - 1, -1, -1)]
+        # MSDN: pVarResult is ignored if DISPATCH_PROPERTYPUT or
+        # DISPATCH_PROPERTYPUTREF is specified.
+        return self.mth(this, *args)
+
+
+def _make_dispinvoker(mth: Callable[..., Any], invkind: int) -> _DispInvoker:
+    """Returns the `_dispimpl_` value for an implementation of a member
+    invoked with the `invkind` flags.
+    """
+    if invkind & (DISPATCH_PROPERTYPUT | DISPATCH_PROPERTYPUTREF):
+        return _DispPropPutInvoker(mth)
+    # invkind & (DISPATCH_METHOD | DISPATCH_PROPERTYGET)
+    if getattr(mth, "has_outargs", False):
+        return _DispOutInvoker(mth)
+    return _DispInvoker(mth)
+
+
+def _dispimpl_key(dispid: int, invkind: int) -> int:
+    """Returns the `_dispimpl_` key for a dispid and invoke kind.
+
+    The dispid and the (WORD sized) invoke kind flags are packed into one
+    integer, which is cheaper to hash than a tuple.
+    """
+    return (dispid << 16) | invkind
+
+
 def create_dispimpl(
     itf: Type[IUnknown], finder: _MethodFinder
-) -> Dict[Tuple[comtypes.dispid, int], Callable[..., Any]]:
-    dispimpl: Dict[Tuple[comtypes.dispid, int], Callable[..., Any]] = {}
+) -> Dict[int, Callable[..., Any]]:
+    dispimpl: Dict[int, Callable[..., Any]] = {}
     for m in itf._disp_methods_:
         #################
         # What we have:
@@ -386,7 +691,7 @@ def create_dispimpl(
 
 def _make_dispmthentry(
     itf: Type[IUnknown], finder: _MethodFinder, m: "_DispMemberSpec"
-) -> Iterator[Tuple[Tuple[comtypes.dispid, int], Callable[..., Any]]]:
+) -> Iterator[Tuple[int, Callable[..., Any]]]:
     if "propget" in m.idlflags:
         invkind = DISPATCH_PROPERTYGET
         mthname = f"_get_{m.name}"
@@ -408,7 +713,7 @@ def _make_dispmthentry(
 
 def _make_disppropentry(
     itf: Type[IUnknown], finder: _MethodFinder, m: "_DispMemberSpec"
-) -> Iterator[Tuple[Tuple[comtypes.dispid, int], Callable[..., Any]]]:
+) -> Iterator[Tuple[int, Callable[..., Any]]]:
     if m.restype:
         # DISPPROPERTY have implicit "out"
         argspec = m.argspec + ((["out"], m.restype, ""),)
@@ -431,15 +736,18 @@ def _make_dispentry(
     idlflags: "_DispIdlFlags",
     argspec: Tuple["hints.ArgSpecElmType", ...],
     invkind: int,
-) -> Iterator[Tuple[Tuple[comtypes.dispid, int], Callable[..., Any]]]:
+) -> Iterator[Tuple[int, Callable[..., Any]]]:
     # We build a _dispmap_ entry now that maps invkind and dispid to
-    # implementations that the finder finds; IDispatch_Invoke will later call it.
+    # invokers of the implementations that the finder finds; IDispatch_Invoke
+    # will later call them.
     paramflags = tuple(((_encode_idl(x[0]), x[1]) + tuple(x[3:])) for x in argspec)
     # XXX can the dispid be at a different index?  Check codegenerator.
     dispid = idlflags[0]
     impl = finder.get_impl(interface, mthname, paramflags, idlflags)  # type: ignore
-    yield ((dispid, invkind), impl)  # type: ignore
+    invoker = _make_dispinvoker(impl, invkind)
+    yield (_dispimpl_key(dispid, invkind), invoker)  # type: ignore
     # invkind is really a set of flags; we allow both DISPATCH_METHOD and
     # DISPATCH_PROPERTYGET (win32com uses this, maybe other languages too?)
     if invkind in (DISPATCH_METHOD, DISPATCH_PROPERTYGET):
-        yield ((dispid, DISPATCH_METHOD | DISPATCH_PROPERTYGET), impl)  # type: ignore
+        key = _dispimpl_key(dispid, DISPATCH_METHOD | DISPATCH_PROPERTYGET)  # type: ignore
+        yield (key, invoker)
@@ -19,6 +19,7 @@ from typing import Union as _UnionT
 import comtypes
 from comtypes import COMObject, IUnknown, hresult
 from comtypes._comobject import _MethodFinder
+from comtypes._vtbl import _MISSING, _dispimpl_key, _make_dispinvoker
 from comtypes.automation import DISPATCH_METHOD, IDispatch
 from comtypes.client._generate import GetModule
 from comtypes.connectionpoints import IConnectionPoint, IConnectionPointContainer
@@ -231,10 +232,10 @@ class _SinkMethodFinder(_MethodFinder):
         try:
             return super().find_method(fq_name, mthname)
         except AttributeError:
-            try:
-                return getattr(self.sink, fq_name)
-            except AttributeError:
-                return getattr(self.sink, mthname)
+            impl = getattr(self.sink, fq_name, _MISSING)
+            if impl is not _MISSING:
+                return impl
+            return getattr(self.sink, mthname)
 
 
 def CreateEventReceiver(interface: Type[IUnknown], handler: Any) -> COMObject:
@@ -261,7 +262,8 @@ def CreateEventReceiver(interface: Type[IUnknown], handler: Any) -> COMObject:
             impl = finder.get_impl(interface, m.name, m.paramflags, m.idlflags)
             # XXX Wouldn't work for 'propget', 'propput', 'propputref'
             # methods - are they allowed on event interfaces?
-            dispimpl[(dispid, DISPATCH_METHOD)] = impl
+            key = _dispimpl_key(dispid, DISPATCH_METHOD)
+            dispimpl[key] = _make_dispinvoker(impl, DISPATCH_METHOD)
 
     return sink
 
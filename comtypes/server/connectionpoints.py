@@ -36,6 +36,7 @@ class ConnectionPointImpl(COMObject):
         self._cookie = 0
         self._sink_interface = sink_interface
         self._typeinfo = sink_typeinfo
+        self._dispids: Dict[str, int] = {}
 
     # per MSDN, all interface methods *must* be implemented, E_NOTIMPL
     # is no allowed return value
@@ -78,8 +79,11 @@ class ConnectionPointImpl(COMObject):
         # Is it an IDispatch derived interface?  Then, events have to be delivered
         # via Invoke calls (even if it is a dual interface).
         if hasattr(self._sink_interface, "Invoke"):
-            # for better performance, we could cache the dispids.
-            dispid = self._typeinfo.GetIDsOfNames(name)[0]
+            # The dispids are cached by event name.
+            dispid = self._dispids.get(name)
+            if dispid is None:
+                dispid = self._typeinfo.GetIDsOfNames(name)[0]
+                self._dispids[name] = dispid
             for key, p in self._connections.items():
                 mth = functools.partial(p.Invoke, dispid)  # type: ignore
                 results.extend(self._call_sink(name, key, mth, *args, **kw))
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import sys
@@ -34,6 +35,18 @@ from comtypes.gen import TestDispServerLib
 ################################################################
 
 
+# The names of the events fired by the eval methods.
+_EVAL_STARTED = sys.intern("EvalStarted")
+_EVAL_COMPLETED = sys.intern("EvalCompleted")
+
+
+# Clients evaluate the same expressions over and over, so they are
+# compiled only once.
+@functools.lru_cache(maxsize=256)
+def _compile(expr):
+    return compile(expr, "<eval>", "eval")
+
+
 # Implement the CoClass by defining a subclass of the
 # TestDispServerLib.TestDispServer class in the wrapper file.  The
 # COMObject base class provides default implementations of the
@@ -62,18 +75,22 @@ class TestDispServer(
     ################################
     # DTestDispServer methods
 
-    def DTestDispServer_eval(self, this, expr, presult):
-        self.Fire_Event(0, "EvalStarted", expr)
+    # 'eval' and 'S_OK' are bound as default arguments, so that they are
+    # local names instead of global lookups.
+    def DTestDispServer_eval(self, this, expr, presult, _eval=eval, _S_OK=S_OK):
+        fire = self.Fire_Event
+        fire(0, _EVAL_STARTED, expr)
         # The following two are equivalent, but the former is more generic:
-        presult[0] = eval(expr)
+        presult[0] = _eval(_compile(expr))
         ##presult[0].value = eval(expr)
-        self.Fire_Event(0, "EvalCompleted", expr, presult[0].value)
-        return S_OK
-
-    def DTestDispServer_eval2(self, expr):
-        self.Fire_Event(0, "EvalStarted", expr)
-        result = eval(expr)
-        self.Fire_Event(0, "EvalCompleted", expr, result)
+        fire(0, _EVAL_COMPLETED, expr, presult[0].value)
+        return _S_OK
+
+    def DTestDispServer_eval2(self, expr, _eval=eval):
+        fire = self.Fire_Event
+        fire(0, _EVAL_STARTED, expr)
+        result = _eval(_compile(expr))
+        fire(0, _EVAL_COMPLETED, expr, result)
         return result
 
     def DTestDispServer__get_id(self, this, pid):
@@ -4,9 +4,30 @@ from ctypes import POINTER, byref, pointer
 from unittest import mock
 
 import comtypes.client
-from comtypes import CLSCTX_SERVER, COMObject, IPersist, IUnknown, hresult
+from comtypes import (
+    CLSCTX_SERVER,
+    DISPMETHOD,
+    GUID,
+    COMObject,
+    IPersist,
+    IUnknown,
+    dispid,
+    hresult,
+)
+from comtypes._memberspec import (
+    DISPATCH_METHOD,
+    DISPATCH_PROPERTYGET,
+    DISPATCH_PROPERTYPUT,
+)
 from comtypes._post_coinit.misc import _CoCreateInstance
-from comtypes.automation import IDispatch
+from comtypes._vtbl import _dispimpl_key
+from comtypes.automation import (
+    DISPID_NEWENUM,
+    DISPID_VALUE,
+    DISPPARAMS,
+    VARIANT,
+    IDispatch,
+)
 from comtypes.typeinfo import GUIDKIND_DEFAULT_SOURCE_DISP_IID
 
 comtypes.client.GetModule("UIAutomationCore.dll")
@@ -157,3 +178,101 @@ class Test_Vtbl(ut.TestCase):
         self.assertNotIn(IDispatch._iid_, cuia._com_pointers_)
         self.assertIn(stdole.IPictureDisp._iid_, stdpic._com_pointers_)
         self.assertIn(uiac.IUIAutomation._iid_, cuia._com_pointers_)
+
+    def test_com_pointers_raw(self):
+        cuia = uiac.CUIAutomation()
+        self.assertEqual(len(cuia._com_pointers_raw_), len(cuia._com_pointers_))
+        for iid, ptr in cuia._com_pointers_.items():
+            self.assertIs(cuia._com_pointers_raw_[bytes(iid)], ptr)
+
+
+class IDispKeys(IDispatch):
+    _iid_ = GUID("{AF00650F-A993-46B1-B109-318AF5FF96A9}")
+    _disp_methods_ = [
+        DISPMETHOD([dispid(DISPID_NEWENUM)], ctypes.c_int, "_NewEnum"),
+        DISPMETHOD(
+            [dispid(DISPID_VALUE)], ctypes.c_int, "Item", ([], ctypes.c_int, "index")
+        ),
+    ]
+
+
+class DispKeysObject(COMObject):
+    _com_interfaces_ = [IDispKeys]
+
+    def _NewEnum(self):
+        return 42
+
+    def Item(self, index):
+        return index * 2
+
+
+class Test_IDispatch_Invoke(ut.TestCase):
+    def invoke(self, obj, memid, invkind, *args):
+        array = (VARIANT * len(args))()
+        for i, a in enumerate(args[::-1]):
+            array[i].value = a
+        dp = DISPPARAMS()
+        dp.cArgs = len(args)
+        dp.rgvarg = array
+        var = VARIANT()
+        hr = obj.IDispatch_Invoke(
+            None,
+            memid,
+            pointer(GUID()),
+            0,
+            invkind,
+            pointer(dp),
+            pointer(var),
+            None,
+            None,
+        )
+        return hr, var.value
+
+    def test_dispimpl_keys(self):
+        obj = DispKeysObject()
+        for memid in (DISPID_NEWENUM, DISPID_VALUE):
+            for invkind in (DISPATCH_METHOD, DISPATCH_METHOD | DISPATCH_PROPERTYGET):
+                self.assertIn(_dispimpl_key(memid, invkind), obj._dispimpl_)
+        self.assertEqual(len(obj._dispimpl_), 4)
+
+    def test_negative_dispid(self):
+        obj = DispKeysObject()
+        self.assertEqual(
+            self.invoke(obj, DISPID_NEWENUM, DISPATCH_METHOD), (hresult.S_OK, 42)
+        )
+        self.assertEqual(
+            self.invoke(obj, DISPID_NEWENUM, DISPATCH_METHOD | DISPATCH_PROPERTYGET),
+            (hresult.S_OK, 42),
+        )
+        hr, _ = self.invoke(obj, DISPID_NEWENUM, DISPATCH_PROPERTYPUT, 1)
+        self.assertEqual(hr, hresult.DISP_E_MEMBERNOTFOUND)
+
+    def test_dispid_value(self):
+        obj = DispKeysObject()
+        self.assertEqual(
+            self.invoke(obj, DISPID_VALUE, DISPATCH_METHOD, 21), (hresult.S_OK, 42)
+        )
+        self.assertEqual(
+            self.invoke(obj, DISPID_VALUE, DISPATCH_METHOD | DISPATCH_PROPERTYGET, 4),
+            (hresult.S_OK, 8),
+        )
+        hr, _ = self.invoke(obj, DISPID_VALUE, DISPATCH_PROPERTYPUT, 1)
+        self.assertEqual(hr, hresult.DISP_E_MEMBERNOTFOUND)
+
+
+class Test_ComInterfaces_Subclass(ut.TestCase):
+    def test_subclass_adds_interface(self):
+        class CUIAutomationWithDispKeys(uiac.CUIAutomation):
+            _com_interfaces_ = uiac.CUIAutomation._com_interfaces_ + [IDispKeys]
+
+        # The base class is instantiated first, so that its interfaces
+        # are already cached when the subclass is instantiated.
+        base = uiac.CUIAutomation()
+        sub = CUIAutomationWithDispKeys()
+        self.assertNotIn(IDispKeys._iid_, base._com_pointers_)
+        self.assertIn(IDispKeys._iid_, sub._com_pointers_)
+        self.assertIn(uiac.IUIAutomation._iid_, sub._com_pointers_)
+        self.assertLess(set(base._com_pointers_), set(sub._com_pointers_))
+        # Instantiating the subclass did not change the cache of the base.
+        self.assertNotIn(IDispKeys._iid_, uiac.CUIAutomation()._com_pointers_)
+        self.assertIn(IDispKeys._iid_, CUIAutomationWithDispKeys()._com_pointers_)